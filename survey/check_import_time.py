@@ -0,0 +1,55 @@
+#Import-time check for app.py.
+#
+#Runs the module-level imports of app.py under `python -X importtime` in a
+#fresh interpreter and prints the slowest top-level packages.  Fails (exit 1)
+#if one of the analytics-only packages is pulled in at module level, or if the
+#imports take longer than the budget:
+#
+#    python check_import_time.py [budget_seconds]      (default 1.5 s)
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+APP_FILE = Path(__file__).resolve().parent / "app.py"
+HEAVY    = ("pandas", "altair", "matplotlib", "scipy", "adjustText")   # only for page 99
+BUDGET_S = 1.5
+
+def import_header(path=None) -> str:
+    #Source of every top-level import statement of *path* (default app.py).
+    tree = ast.parse((path or APP_FILE).read_text())
+    return "\n".join(ast.unparse(n) for n in tree.body
+                     if isinstance(n, (ast.Import, ast.ImportFrom)))
+
+def import_times(code: str) -> list[tuple[int, int, str]]:
+    #(self µs, cumulative µs, module) for every module imported by *code*;
+    #nested modules keep their leading spaces, as printed by -X importtime.
+    #Interpreter start-up imports (site, encodings, …) are left out.
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+    rows = []
+    start = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                           capture_output=True, text=True).stderr.splitlines()
+    for line in proc.stderr.splitlines()[len(start):]:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cum, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(own), int(cum), name[1:]))
+    return rows
+
+def main(budget=BUDGET_S, path=None) -> int:
+    rows  = import_times(import_header(path))
+    top   = [r for r in rows if not r[2].startswith(" ")]
+    total = sum(cum for _, cum, _ in top) / 1e6
+    heavy = sorted({name.strip().split(".")[0] for _, _, name in rows} & set(HEAVY))
+
+    print(f"{(path or APP_FILE).name}: module-level imports {total:.2f} s (budget {budget:.2f} s)")
+    for _, cum, name in sorted(top, reverse=True, key=lambda r: r[1])[:10]:
+        print(f"  {cum / 1e6:6.3f} s  {name}")
+    if heavy:
+        print("analytics-only packages imported at module level:", ", ".join(heavy))
+    return 1 if heavy or total > budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main(float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_S))